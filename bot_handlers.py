@@ -1,5 +1,6 @@
 import telegram
 import logging
+import re
 import requests
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
@@ -12,11 +13,62 @@ from tmdb_service import (
     get_similar_movies,
     get_popular_movies,
     discover_movies_by_genre,
-    get_genres
+    get_genres,
+    normalize_title_query
 )
 
 logger = logging.getLogger(__name__)
 
+# Sapaan dan obrolan umum yang bukan judul film (hanya dicek pada teks bebas)
+NON_TITLE_PHRASES = {
+    "hai", "halo", "hallo", "p", "assalamualaikum",
+    "selamat pagi", "selamat siang", "selamat sore", "selamat malam",
+    "makasih", "terima kasih", "thx"
+}
+# Partikel obrolan yang hanya dibuang dari akhir teks bebas
+TRAILING_PARTICLES = {"dong", "donk", "deh", "sih", "nih", "kak", "gan", "min"}
+# Kata pembuka yang hanya dibuang dari awal teks bebas
+LEADING_PREFIXES = {"tolong", "coba", "judul", "judulnya"}
+LAUGHTER_PATTERN = re.compile(r"^(wk)+w?$|^(ha){4,}h?$|^(he){4,}h?$")
+MAX_TITLE_QUERY_LENGTH = 100
+
+def _strip_filler_words(text):
+    """
+    Membuang kata pembuka di awal dan partikel obrolan di akhir teks bebas.
+    "film" di awal hanya dibuang jika ada kata pembuka/partikel lain, agar judul
+    seperti "Film Stars Don't Die in Liverpool" tetap utuh.
+    Jika semuanya terbuang, teks asli dikembalikan.
+    """
+    def clean(word):
+        return word.lower().strip("!?.,")
+
+    words = text.split()
+    start, end = 0, len(words)
+    while end > start and clean(words[end - 1]) in TRAILING_PARTICLES:
+        end -= 1
+    while start < end and clean(words[start]) in LEADING_PREFIXES:
+        start += 1
+    is_chatty = start > 0 or end < len(words)
+    if is_chatty and start < end and clean(words[start]) == "film":
+        start += 1
+    return " ".join(words[start:end]) or text.strip()
+
+def _looks_like_title(text):
+    """
+    Pre-filter murah untuk teks bebas: False hanya untuk sapaan, tawa, atau teks yang jelas bukan judul.
+    """
+    query = normalize_title_query(text)
+    if not query or len(query) > MAX_TITLE_QUERY_LENGTH:
+        return False
+    if query in NON_TITLE_PHRASES:
+        return False
+    compact = query.replace(" ", "")
+    if LAUGHTER_PATTERN.match(compact): # contoh: "wkwkwk", "hahahaha"
+        return False
+    if len(compact) > 2 and len(set(compact)) == 1 and not compact.isdigit(): # contoh: "aaaaa"
+        return False
+    return any(ch.isalnum() for ch in query)
+
 async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE): #
     user = update.effective_user #
     get_genres() 
@@ -282,8 +334,13 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
         await handle_recommendation_request(update, context, genre=genre, source="NLP Text")
     else:
         # Fallback: jika tidak ada maksud jelas, anggap sebagai pencarian judul
-        logger.info(f"NLP: Tidak ada maksud jelas, mencoba sebagai pencarian judul: '{user_text}'")
-        context.args = user_text.split() 
+        if not _looks_like_title(user_text):
+            logger.info(f"NLP: Teks '{user_text}' bukan judul, pencarian dilewati")
+            await update.message.reply_text("Aku belum paham maksudnya 😅 Kalau itu judul film, cari dengan /carijudul [Judul film]. Gunakan /rekomendasi untuk saran film.")
+            return
+        title_query = _strip_filler_words(user_text)
+        logger.info(f"NLP: Tidak ada maksud jelas, mencoba sebagai pencarian judul: '{title_query}'")
+        context.args = title_query.split() 
         await cari_judul_handler(update, context)
 
 
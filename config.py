@@ -11,4 +11,9 @@ if not TELEGRAM_TOKEN:
     raise ValueError("TELEGRAM_TOKEN belum ditambahkan")
 
 TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
-TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500/"
\ No newline at end of file
+TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500/"
+
+# Cache hasil pencarian judul (dalam detik)
+SEARCH_CACHE_TTL = 60 * 60
+SEARCH_NEGATIVE_CACHE_TTL = 5 * 60
+SEARCH_CACHE_MAX_SIZE = 500
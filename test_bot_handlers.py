@@ -0,0 +1,65 @@
+import asyncio
+import os
+from unittest import mock
+
+import pytest
+
+os.environ.setdefault("TMDB_API_KEY", "test-key")
+os.environ.setdefault("TELEGRAM_TOKEN", "test-token")
+
+import bot_handlers
+from bot_handlers import _looks_like_title, _strip_filler_words
+
+
+@pytest.mark.parametrize("text", ["halo", "Hai!", "terima kasih", "wkwkwk", "hahahaha", "aaaaa", "???", "x" * 101])
+def test_non_title_text_is_skipped(text):
+    assert not _looks_like_title(text)
+
+
+@pytest.mark.parametrize("text", ["Help!", "Hello", "Okay", "Hi", "Ha", "Thanks", "Ya", "Apa", "Yang", "M", "1917", "Hahaha"])
+def test_real_titles_pass_prefilter(text):
+    assert _looks_like_title(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("film inception dong", "inception"),
+    ("judul film dune", "dune"),
+    ("coba interstellar", "interstellar"),
+    ("avatar nih kak", "avatar"),
+    ("film stars don't die in liverpool", "film stars don't die in liverpool"),
+    ("please vote for me", "please vote for me"),
+    ("yang mulia", "yang mulia"),
+    ("the film", "the film"),
+    ("the film critic ya", "the film critic ya"),
+    ("film", "film"),
+    ("dong", "dong"),
+])
+def test_strip_filler_words(text, expected):
+    assert _strip_filler_words(text) == expected
+
+
+def _text_update(text):
+    update = mock.Mock()
+    update.message.text = text
+    update.message.reply_text = mock.AsyncMock()
+    update.effective_user.first_name = "Tester"
+    return update
+
+
+def test_junk_text_gets_hint_without_search():
+    update, context = _text_update("wkwkwk"), mock.Mock()
+    with mock.patch.object(bot_handlers, "search_movie_by_title") as search:
+        asyncio.run(bot_handlers.handle_text_message(update, context))
+
+    search.assert_not_called()
+    update.message.reply_text.assert_awaited_once()
+    assert "/carijudul" in update.message.reply_text.await_args.args[0]
+
+
+def test_title_with_filler_reaches_search_cleaned():
+    update, context = _text_update("Film Interstellar dong"), mock.Mock()
+    with mock.patch.object(bot_handlers, "cari_judul_handler", new_callable=mock.AsyncMock) as handler:
+        asyncio.run(bot_handlers.handle_text_message(update, context))
+
+    handler.assert_awaited_once_with(update, context)
+    assert context.args == ["interstellar"]
@@ -0,0 +1,118 @@
+import os
+from unittest import mock
+
+import pytest
+import requests
+
+os.environ.setdefault("TMDB_API_KEY", "test-key")
+os.environ.setdefault("TELEGRAM_TOKEN", "test-token")
+
+import tmdb_service
+from config import SEARCH_CACHE_TTL, SEARCH_NEGATIVE_CACHE_TTL
+
+
+def _response(results):
+    response = mock.Mock()
+    response.json.return_value = {"results": results}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    tmdb_service._search_cache.clear()
+    yield
+    tmdb_service._search_cache.clear()
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with mock.patch.object(tmdb_service.time, "monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_normalize_title_query():
+    assert tmdb_service.normalize_title_query("  INCEPTION  ") == "inception"
+    assert tmdb_service.normalize_title_query("Spider-Man: No  Way Home!") == "spider man no way home"
+    assert tmdb_service.normalize_title_query("Film") == "film"
+    assert tmdb_service.normalize_title_query("???") == "???"
+    assert tmdb_service.normalize_title_query("") == ""
+
+
+def test_repeated_queries_hit_cache_once():
+    movies = [{"id": i} for i in range(6)]
+    with mock.patch.object(tmdb_service.requests, "get", return_value=_response(movies)) as get:
+        assert len(tmdb_service.search_movie_by_title("Inception", count=3)) == 3
+        assert len(tmdb_service.search_movie_by_title("inception!!")) == 5
+        assert len(tmdb_service.search_movie_by_title("  INCEPTION  ")) == 5
+
+    assert get.call_count == 1
+
+
+def test_original_title_is_sent_to_tmdb():
+    with mock.patch.object(tmdb_service.requests, "get", return_value=_response([])) as get:
+        tmdb_service.search_movie_by_title("  Please Vote  for Me ")
+        tmdb_service.search_movie_by_title("Schindler's List")
+        tmdb_service.search_movie_by_title("Yang")
+
+    queries = [call.kwargs["params"]["query"] for call in get.call_args_list]
+    assert queries == ["Please Vote for Me", "Schindler's List", "Yang"]
+
+
+def test_returned_movies_do_not_mutate_cache():
+    with mock.patch.object(tmdb_service.requests, "get", return_value=_response([{"id": 1, "title": "Dune"}])):
+        tmdb_service.search_movie_by_title("Dune")[0].update({"credits": {}, "videos": {}})
+        tmdb_service.search_movie_by_title("Dune")[0].update({"runtime": 155})
+
+    _, cached = tmdb_service._search_cache["dune"]
+    assert cached == [{"id": 1, "title": "Dune"}]
+    assert tmdb_service.search_movie_by_title("Dune") == [{"id": 1, "title": "Dune"}]
+
+
+def test_positive_cache_expires(clock):
+    with mock.patch.object(tmdb_service.requests, "get", return_value=_response([{"id": 1}])) as get:
+        tmdb_service.search_movie_by_title("Dune")
+        clock[0] += SEARCH_CACHE_TTL - 1
+        tmdb_service.search_movie_by_title("Dune")
+        assert get.call_count == 1
+
+        clock[0] += 2
+        tmdb_service.search_movie_by_title("Dune")
+        assert get.call_count == 2
+
+
+def test_miss_is_cached_until_negative_ttl(clock):
+    with mock.patch.object(tmdb_service.requests, "get", return_value=_response([])) as get:
+        assert tmdb_service.search_movie_by_title("xyzq") is None
+        clock[0] += SEARCH_NEGATIVE_CACHE_TTL - 1
+        assert tmdb_service.search_movie_by_title("XYZQ") is None
+        assert get.call_count == 1
+
+        clock[0] += 2
+        assert tmdb_service.search_movie_by_title("xyzq") is None
+        assert get.call_count == 2
+
+
+def test_request_error_is_not_cached():
+    error = requests.exceptions.ConnectionError("down")
+    with mock.patch.object(tmdb_service.requests, "get", side_effect=[error, _response([{"id": 1}])]) as get:
+        with pytest.raises(requests.exceptions.RequestException):
+            tmdb_service.search_movie_by_title("Inception")
+        assert tmdb_service.search_movie_by_title("Inception") == [{"id": 1}]
+
+    assert get.call_count == 2
+
+
+def test_lru_eviction():
+    with mock.patch.object(tmdb_service, "SEARCH_CACHE_MAX_SIZE", 2), \
+         mock.patch.object(tmdb_service.requests, "get", return_value=_response([{"id": 1}])) as get:
+        tmdb_service.search_movie_by_title("a1")
+        tmdb_service.search_movie_by_title("b2")
+        tmdb_service.search_movie_by_title("a1") # a1 jadi yang terbaru dipakai
+        tmdb_service.search_movie_by_title("c3") # b2 dibuang
+        assert get.call_count == 3
+
+        tmdb_service.search_movie_by_title("a1")
+        assert get.call_count == 3
+        tmdb_service.search_movie_by_title("b2")
+        assert get.call_count == 4
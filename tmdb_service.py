@@ -1,10 +1,22 @@
 import requests
 import logging
-
-from config import TMDB_API_BASE_URL, TMDB_API_KEY #
+import re
+import time
+from collections import OrderedDict
+
+from config import ( #
+    TMDB_API_BASE_URL,
+    TMDB_API_KEY,
+    SEARCH_CACHE_TTL,
+    SEARCH_NEGATIVE_CACHE_TTL,
+    SEARCH_CACHE_MAX_SIZE
+)
 logger = logging.getLogger(__name__)
 
 _genre_cache = None
+_search_cache = OrderedDict() # query ternormalisasi -> (waktu kedaluwarsa, hasil atau None)
+
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]|_")
 
 def get_genres():
     """
@@ -30,19 +42,67 @@ def get_genres():
         return {}
 
 
+def normalize_title_query(text):
+    """
+    Menormalkan teks pencarian judul untuk kunci cache: huruf kecil,
+    tanda baca diganti spasi, dan spasi dirapikan.
+    Hanya dipakai sebagai kunci cache, bukan sebagai query ke TMDB.
+    """
+    if not text:
+        return ""
+
+    normalized = " ".join(_NON_WORD_PATTERN.sub(" ", text.lower()).split())
+    # Teks yang isinya hanya tanda baca tetap butuh kunci sendiri
+    return normalized or " ".join(text.lower().split())
+
+def _get_cached_search(query):
+    """
+    Mengambil hasil pencarian dari cache. Mengembalikan (ditemukan, hasil).
+    """
+    entry = _search_cache.get(query)
+    if entry is None:
+        return False, None
+
+    expires_at, results = entry
+    if expires_at < time.monotonic():
+        del _search_cache[query]
+        return False, None
+
+    _search_cache.move_to_end(query)
+    return True, results
+
+def _store_cached_search(query, results):
+    """
+    Menyimpan salinan hasil pencarian ke cache. Hasil kosong (None) disimpan dengan TTL lebih pendek.
+    """
+    ttl = SEARCH_CACHE_TTL if results else SEARCH_NEGATIVE_CACHE_TTL
+    cached = [dict(movie) for movie in results] if results else None # Salinan agar perubahan pemanggil tidak masuk cache
+    _search_cache[query] = (time.monotonic() + ttl, cached)
+    _search_cache.move_to_end(query)
+    while len(_search_cache) > SEARCH_CACHE_MAX_SIZE:
+        _search_cache.popitem(last=False)
+
 def search_movie_by_title(movie_title, count=5): #
     """
     Mencari film berdasarkan judul di TMDB.
     Mengembalikan daftar film yang ditemukan (hingga 'count') atau None jika tidak ada.
+    Hasil disimpan di cache berdasarkan judul yang sudah dinormalkan, termasuk hasil kosong.
     """ #
 
-    if not movie_title: #
+    query = " ".join(movie_title.split()) if movie_title else ""
+    if not query: #
         return None #
 
+    cache_key = normalize_title_query(query)
+    found, cached_results = _get_cached_search(cache_key)
+    if found:
+        logger.debug(f"Cache pencarian dipakai untuk '{cache_key}'")
+        return [dict(movie) for movie in cached_results[:count]] if cached_results else None
+
     api_url = f"{TMDB_API_BASE_URL}/search/movie" #
     params = { #
         'api_key': TMDB_API_KEY, #
-        'query': movie_title, #
+        'query': query, #
         'language': 'id-ID', #
         'page': 1 #
     }
@@ -52,8 +112,11 @@ def search_movie_by_title(movie_title, count=5): #
         response.raise_for_status() #
         data = response.json() #
 
-        if data['results']: #
-            return data['results'][:count] #
+        results = data['results'] or None
+        _store_cached_search(cache_key, results)
+
+        if results: #
+            return results[:count] #
         else:
             return None #
 